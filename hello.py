@@ -1,15 +1,31 @@
 #!/usr/bin/env python3
+import atexit
+import heapq
 import json
+import mmap
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from getpass import getpass
 import argparse
 import pytz
 from colorama import Fore, Back, Style, init
-from cryptography.fernet import Fernet
-import dropbox  # pip install dropbox
-import markdown  # pip install markdown
+# dropbox, markdown and the Fernet backends are heavy to import and only
+# needed for sync, export and encryption, so they are imported on first use
+try:
+    import orjson  # pip install orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson  # pip install ijson
+except ImportError:
+    ijson = None
+try:
+    import zstandard as zstd  # pip install zstandard
+except ImportError:
+    zstd = None
 
 # Initialize colorama
 init(autoreset=True)
@@ -18,20 +34,138 @@ init(autoreset=True)
 NOTES_FILE = "notes.json"
 CONFIG_FILE = "config.json"
 KEY_FILE = ".key"
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024  # Must be a multiple of 4 MiB for concurrent sessions
+UPLOAD_WORKERS = 4
+SYNC_DELAY = 5.0  # Seconds without edits before pending changes are uploaded
+FERNET_MAGIC = b"gAAAAA"  # Base64 of the Fernet version byte that starts every token
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 6
+
+# Menus are assembled once and printed with a single call
+MAIN_MENU = "\n".join([
+    Fore.YELLOW + "\nNOTE TAKER PRO" + Style.RESET_ALL,
+    Fore.CYAN + "1. Create Note" + Style.RESET_ALL,
+    "2. List Notes",
+    "3. View Note",
+    "4. Edit Note",
+    "5. Delete Note",
+    "6. Search Notes",
+    "7. Check Reminders",
+    "8. Export Note",
+    "9. Settings",
+    "10. Sync Now",
+    "11. Exit",
+])
+MAIN_PROMPT = Fore.CYAN + "\nEnter your choice (1-11): " + Style.RESET_ALL
+SETTINGS_MENU = "\n".join([
+    Fore.YELLOW + "\nSETTINGS" + Style.RESET_ALL,
+    Fore.CYAN + "1. Toggle Encryption (Currently: {encrypted})" + Style.RESET_ALL,
+    "2. Toggle Cloud Sync (Currently: {cloud_sync})",
+    "3. Set Timezone (Currently: {timezone})",
+    "4. Set Dropbox Token",
+    "5. Back to Main Menu",
+])
+SETTINGS_PROMPT = Fore.CYAN + "Enter your choice (1-5): " + Style.RESET_ALL
+
+# Export templates, filled with str.format_map
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>{title}</title>
+    <meta charset="UTF-8">
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
+        h1 {{ color: #333; }}
+        .meta {{ color: #666; font-size: 0.9em; }}
+        .content {{ margin-top: 20px; }}
+        .tags {{ margin-top: 20px; color: #0066cc; }}
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <div class="meta">
+        Created: {created}<br>
+        Modified: {modified}
+    </div>
+    <div class="content">
+        {content}
+    </div>
+    <div class="tags">
+        Tags: {tags}
+    </div>
+</body>
+</html>
+"""
+MD_TEMPLATE = """# {title}
+
+**Created:** {created}  
+**Modified:** {modified}  
+
+{content}
+
+**Tags:** {tags}
+"""
+
+
+def json_loads(buf):
+    """Parse JSON from a bytes-like buffer, using orjson when available"""
+    if orjson:
+        with memoryview(buf) as view:
+            return orjson.loads(view)
+    return json.loads(bytes(buf))
+
+
+def json_dumps(data):
+    """Serialize data to compact JSON bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+class RFernet:
+    """Wrap rfernet's str-based tokens in the bytes API of cryptography's Fernet"""
+    def __init__(self, key):
+        import rfernet  # pip install rfernet
+        self._fernet = rfernet.Fernet(key.decode())
+    
+    def encrypt(self, data):
+        return self._fernet.encrypt(data).encode()
+    
+    def decrypt(self, token):
+        return self._fernet.decrypt(token.decode())
+
 
 class NoteTakerPro:
+    _markdown = None  # Shared converter, created on the first HTML export
+    
     def __init__(self):
-        self.notes = []
+        self.notes = None  # Loaded on first use
+        self._by_id = {}
+        self._reminders = []
+        self._reminder_times = {}  # Parsed reminder datetime per note id
+        self._columns = None  # Search columns, rebuilt after notes change
+        self._last_json = None  # Unencrypted JSON of the notes as last saved
+        self._load_error = None  # Set when the notes file could not be read
+        self.cipher = None
         self.config = {
             'encrypted': False,
             'cloud_sync': False,
             'dropbox_token': None,
-            'timezone': 'UTC'
+            'timezone': 'UTC',
+            # Must match on every synced client: compressed notes live at a separate path
+            'cloud_compress': True
         }
         self.load_config()
+        self._tz = pytz.timezone(self.config['timezone'])
         self.setup_encryption()
-        self.load_notes()
         self.dbx = None
+        self._dirty = False
+        self._sync_timer = None
+        self._last_upload = None  # Future of the most recently queued upload
+        self._sync_lock = threading.Lock()
+        # A single worker keeps uploads of notes.json in the order they were made
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        atexit.register(self.close)
         if self.config['cloud_sync']:
             self.setup_dropbox()
     
@@ -52,32 +186,40 @@ class NoteTakerPro:
             return
             
         if not os.path.exists(KEY_FILE):
+            from cryptography.fernet import Fernet
             key = Fernet.generate_key()
             with open(KEY_FILE, 'wb') as f:
                 f.write(key)
-        else:
-            with open(KEY_FILE, 'rb') as f:
-                key = f.read()
-        
-        self.cipher = Fernet(key)
+        self._load_cipher()
+    
+    def _load_cipher(self):
+        """Create the Fernet cipher from the key file"""
+        with open(KEY_FILE, 'rb') as f:
+            key = f.read()
+        try:
+            self.cipher = RFernet(key)
+        except ImportError:
+            from cryptography.fernet import Fernet
+            self.cipher = Fernet(key)
     
     def encrypt(self, data):
-        """Encrypt data"""
+        """Encrypt bytes into a Fernet token"""
         if not self.config['encrypted']:
             return data
-        return self.cipher.encrypt(data.encode()).decode()
+        return self.cipher.encrypt(data)
     
     def decrypt(self, data):
-        """Decrypt data"""
+        """Decrypt a Fernet token back into bytes"""
         if not self.config['encrypted']:
             return data
-        return self.cipher.decrypt(data.encode()).decode()
+        return self.cipher.decrypt(data)
     
     def setup_dropbox(self):
         """Initialize Dropbox connection"""
         if not self.config['dropbox_token']:
             print(Fore.RED + "No Dropbox token configured!")
             return
+        import dropbox  # pip install dropbox
         self.dbx = dropbox.Dropbox(self.config['dropbox_token'])
     
     def sync_to_cloud(self):
@@ -85,57 +227,253 @@ class NoteTakerPro:
         if not self.dbx:
             return
         try:
-            with open(NOTES_FILE, 'rb') as f:
-                self.dbx.files_upload(f.read(), f'/{NOTES_FILE}', mode=dropbox.files.WriteMode.overwrite)
+            data = self._last_json
+            if data is None:
+                with open(NOTES_FILE, 'rb') as f:
+                    data = self._decrypt_notes(f.read())
+            # Compress before encrypting, since ciphertext does not compress
+            if self.config['cloud_compress']:
+                if not zstd:
+                    raise RuntimeError("cloud_compress is on but zstandard is not installed")
+                data = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+            self._upload(self.encrypt(data), self._cloud_path())
             print(Fore.GREEN + "Notes synced to Dropbox!")
         except Exception as e:
             print(Fore.RED + f"Sync failed: {str(e)}")
     
+    def _cloud_path(self):
+        """Dropbox path of the notes, which depends on the cloud_compress setting"""
+        if self.config['cloud_compress']:
+            return f'/{NOTES_FILE}.zst'
+        return f'/{NOTES_FILE}'
+    
+    def _download(self):
+        """Download the notes payload, falling back to the uncompressed legacy copy"""
+        import dropbox
+        try:
+            _, response = self.dbx.files_download(self._cloud_path())
+        except dropbox.exceptions.ApiError as e:
+            missing = e.error.is_path() and e.error.get_path().is_not_found()
+            if not (missing and self.config['cloud_compress']):
+                raise
+            # Nothing compressed yet, so read the copy uploaded by earlier versions
+            _, response = self.dbx.files_download(f'/{NOTES_FILE}')
+        return response.content
+    
+    def _upload(self, data, path):
+        """Upload data to Dropbox, sending large files as concurrent chunks"""
+        import dropbox
+        mode = dropbox.files.WriteMode.overwrite
+        if len(data) <= UPLOAD_CHUNK_SIZE:
+            self.dbx.files_upload(data, path, mode=mode)
+            return
+        
+        session = self.dbx.files_upload_session_start(
+            b'', session_type=dropbox.files.UploadSessionType.concurrent)
+        
+        def append(offset):
+            cursor = dropbox.files.UploadSessionCursor(session.session_id, offset)
+            end = offset + UPLOAD_CHUNK_SIZE
+            self.dbx.files_upload_session_append_v2(data[offset:end], cursor, close=end >= len(data))
+        
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+            list(pool.map(append, range(0, len(data), UPLOAD_CHUNK_SIZE)))
+        
+        cursor = dropbox.files.UploadSessionCursor(session.session_id, len(data))
+        self.dbx.files_upload_session_finish(b'', cursor, dropbox.files.CommitInfo(path, mode=mode))
+    
+    def schedule_sync(self):
+        """Upload notes to Dropbox once edits have settled for SYNC_DELAY seconds"""
+        with self._sync_lock:
+            self._dirty = True
+            if self._sync_timer:
+                self._sync_timer.cancel()
+            self._sync_timer = threading.Timer(SYNC_DELAY, self._flush_to_cloud)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+    
+    def _flush_to_cloud(self):
+        """Queue an upload of pending changes, returning its future if there were any"""
+        with self._sync_lock:
+            if self._sync_timer:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if not self._dirty:
+                return None
+            self._dirty = False
+            try:
+                self._last_upload = self._pool.submit(self.sync_to_cloud)
+                return self._last_upload
+            except RuntimeError:
+                # The pool stops taking work once the interpreter starts exiting
+                pass
+        self.sync_to_cloud()
+        return None
+    
+    def close(self):
+        """Upload any pending changes and wait for queued uploads to finish"""
+        self._flush_to_cloud()
+        self._pool.shutdown(wait=True)
+    
     def sync_from_cloud(self):
         """Sync notes from Dropbox"""
         if not self.dbx:
             return
+        self._flush_to_cloud()
+        # Uploads run in order on one worker, so the last one finishing means all have
+        with self._sync_lock:
+            last_upload = self._last_upload
+        if last_upload:
+            last_upload.result()
         try:
-            self.dbx.files_download_to_file(NOTES_FILE, f'/{NOTES_FILE}')
-            self.load_notes()
+            data = self._decrypt_notes(self._download())
+            if data[:len(ZSTD_MAGIC)] == ZSTD_MAGIC:
+                if not zstd:
+                    raise RuntimeError("cloud notes are compressed but zstandard is not installed")
+                data = zstd.ZstdDecompressor().decompress(data)
+            notes = json_loads(data)
+            if self._renumber_duplicates(notes):
+                self._set_notes(notes)
+                self.save_notes()
+            else:
+                self._set_notes(notes)
+                self._write_notes_file(self.encrypt(data))
+                self._last_json = data
             print(Fore.GREEN + "Notes synced from Dropbox!")
         except Exception as e:
             print(Fore.RED + f"Sync failed: {str(e)}")
     
+    def _decrypt_notes(self, buf):
+        """Return the JSON inside buf, decrypting it if it is a Fernet token"""
+        if buf[:len(FERNET_MAGIC)] == FERNET_MAGIC:
+            if self.cipher is None:
+                if not os.path.exists(KEY_FILE):
+                    raise ValueError(f"notes are encrypted but {KEY_FILE} is missing")
+                self._load_cipher()
+            # Decrypt even with encryption turned off, so the next save stores plaintext
+            return self.cipher.decrypt(bytes(buf))
+        return buf
+    
+    def _parse_notes(self, buf):
+        """Decode notes from the raw bytes of a notes file"""
+        return json_loads(self._decrypt_notes(buf))
+    
     def load_notes(self):
         """Load notes from JSON file"""
         if os.path.exists(NOTES_FILE):
-            with open(NOTES_FILE, 'r') as f:
-                try:
-                    data = json.load(f)
-                    if self.config['encrypted']:
-                        self.notes = json.loads(self.decrypt(json.dumps(data)))
+            try:
+                with open(NOTES_FILE, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        notes = []  # mmap cannot map an empty file
                     else:
-                        self.notes = data
-                except Exception as e:
-                    print(Fore.RED + f"Error loading notes: {str(e)}")
-                    self.notes = []
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            notes = self._parse_notes(mm)
+                renumbered = self._renumber_duplicates(notes)
+                self._set_notes(notes)
+                if renumbered:
+                    self.save_notes()
+            except Exception as e:
+                print(Fore.RED + f"Error loading notes: {str(e)}")
+                self._set_notes([])
+                self._load_error = str(e)
         else:
-            self.notes = []
+            self._set_notes([])
+    
+    def _renumber_duplicates(self, notes):
+        """Give fresh ids to notes sharing an id, which older versions could create"""
+        seen = set()
+        duplicates = []
+        for note in notes:
+            if note['id'] in seen:
+                duplicates.append(note)
+            else:
+                seen.add(note['id'])
+        next_id = max(seen, default=0) + 1
+        for note in duplicates:
+            print(Fore.YELLOW + f"Note '{note['title']}' shared ID {note['id']} and is now ID {next_id}.")
+            note['id'] = next_id
+            next_id += 1
+        return bool(duplicates)
+    
+    def _ensure_loaded(self):
+        """Load notes if they have not been loaded yet"""
+        if self.notes is None:
+            self.load_notes()
+    
+    def _has_due_reminders(self, now):
+        """Stream just the reminder fields of the notes file to see if any are due"""
+        with open(NOTES_FILE, 'rb') as f:
+            if f.read(len(FERNET_MAGIC)) == FERNET_MAGIC:
+                return True  # Encrypted notes cannot be streamed
+            f.seek(0)
+            return any(reminder and self._reminder_time(reminder) <= now
+                       for reminder in ijson.items(f, 'item.reminder'))
+    
+    def _set_notes(self, notes):
+        """Replace the notes in memory and rebuild the id and reminder indexes"""
+        self.notes = notes
+        self._load_error = None
+        self._by_id = {n['id']: n for n in notes}
+        self._columns = None
+        self._index_reminders()
+    
+    def _index_reminders(self):
+        """Cache parsed reminder times by note id and rebuild the min-heap of (time, note id)"""
+        self._reminder_times = {n['id']: self._reminder_time(n['reminder'])
+                                for n in self.notes if n.get('reminder')}
+        self._reminders = [(reminder_time, note_id) for note_id, reminder_time in self._reminder_times.items()]
+        heapq.heapify(self._reminders)
+    
+    def _search_columns(self):
+        """Parallel lists of ids and lowercased titles, contents and tags, built on demand"""
+        if self._columns is None:
+            self._columns = (
+                [n['id'] for n in self.notes],
+                [n['title'].lower() for n in self.notes],
+                [n['content'].lower() for n in self.notes],
+                ["\n".join(n['tags']).lower() for n in self.notes],
+            )
+        return self._columns
+    
+    def _timestamp(self):
+        """Current time in the configured timezone as an ISO 8601 string"""
+        return datetime.now(self._tz).isoformat()
+    
+    def _reminder_time(self, reminder):
+        """Parse a stored reminder, reading times without an offset as local time"""
+        reminder_time = datetime.fromisoformat(reminder)
+        if reminder_time.tzinfo is None:
+            reminder_time = self._tz.localize(reminder_time)
+        return reminder_time
+    
+    def _write_notes_file(self, buf):
+        """Replace the notes file with buf atomically via a synced temporary file"""
+        tmp = NOTES_FILE + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, NOTES_FILE)
     
     def save_notes(self):
         """Save notes to JSON file"""
+        if self._load_error:
+            # Saving now would replace the unreadable file with only the notes made since
+            print(Fore.RED + f"Notes not saved: {NOTES_FILE} could not be loaded ({self._load_error}).")
+            return
         try:
-            if self.config['encrypted']:
-                data = json.loads(self.encrypt(json.dumps(self.notes)))
-            else:
-                data = self.notes
-            
-            with open(NOTES_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = json_dumps(self.notes)
+            self._write_notes_file(self.encrypt(data))
+            self._last_json = data
             
             if self.config['cloud_sync']:
-                self.sync_to_cloud()
+                self.schedule_sync()
         except Exception as e:
             print(Fore.RED + f"Error saving notes: {str(e)}")
     
     def create_note(self):
         """Create a new note"""
+        self._ensure_loaded()
         print(Fore.YELLOW + "\nCREATE NEW NOTE")
         title = input(Fore.CYAN + "Title: " + Style.RESET_ALL)
         content = input(Fore.CYAN + "Content: " + Style.RESET_ALL)
@@ -151,85 +489,74 @@ class NoteTakerPro:
             except ValueError:
                 print(Fore.RED + "Invalid date format!")
         
+        now = self._timestamp()
         note = {
-            'id': len(self.notes) + 1,
+            'id': max(self._by_id, default=0) + 1,
             'title': title,
             'content': content,
             'tags': tags,
-            'created': datetime.now(pytz.timezone(self.config['timezone'])).isoformat(),
-            'modified': datetime.now(pytz.timezone(self.config['timezone'])).isoformat(),
+            'created': now,
+            'modified': now,
             'reminder': reminder
         }
         
         self.notes.append(note)
+        self._by_id[note['id']] = note
+        self._columns = None
+        if reminder:
+            self._reminder_times[note['id']] = self._reminder_time(reminder)
+            heapq.heappush(self._reminders, (self._reminder_times[note['id']], note['id']))
         self.save_notes()
         print(Fore.GREEN + "\nNote created successfully!")
     
     def check_reminders(self):
         """Check for due reminders"""
-        now = datetime.now(pytz.timezone(self.config['timezone']))
-        for note in self.notes:
-            if note.get('reminder'):
-                reminder_time = datetime.fromisoformat(note['reminder'])
-                if now >= reminder_time:
-                    print(Fore.RED + f"\nREMINDER: {note['title']} (Due: {reminder_time.strftime('%Y-%m-%d %H:%M')})")
-                    print(note['content'])
-                    # Optionally mark as completed
-                    if input(Fore.CYAN + "Mark as completed? (y/n): " + Style.RESET_ALL).lower() == 'y':
-                        note['reminder'] = None
-                        self.save_notes()
+        now = datetime.now(self._tz)
+        if self.notes is None and ijson and os.path.exists(NOTES_FILE):
+            # Skip the full load at startup when nothing is due
+            try:
+                if not self._has_due_reminders(now):
+                    return
+            except Exception:
+                pass  # Fall back to the full load, which reports any problem
+        self._ensure_loaded()
+        pending = []
+        while self._reminders and self._reminders[0][0] <= now:
+            reminder_time, note_id = heapq.heappop(self._reminders)
+            note = self._by_id[note_id]
+            print(Fore.RED + f"\nREMINDER: {note['title']} (Due: {reminder_time.strftime('%Y-%m-%d %H:%M')})")
+            print(note['content'])
+            # Optionally mark as completed
+            if input(Fore.CYAN + "Mark as completed? (y/n): " + Style.RESET_ALL).lower() == 'y':
+                note['reminder'] = None
+                del self._reminder_times[note_id]
+                self.save_notes()
+            else:
+                pending.append((reminder_time, note_id))
+        for entry in pending:
+            heapq.heappush(self._reminders, entry)
     
     def export_note(self, note_id, format_type):
         """Export note to different formats"""
-        note = next((n for n in self.notes if n['id'] == note_id), None)
+        self._ensure_loaded()
+        note = self._by_id.get(note_id)
         if not note:
             print(Fore.RED + "Note not found!")
             return
         
         filename = f"note_{note_id}_{note['title'].replace(' ', '_')}.{format_type.lower()}"
         
+        fields = dict(note, tags=', '.join(note['tags']))
         if format_type == 'html':
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>{note['title']}</title>
-                <meta charset="UTF-8">
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-                    h1 {{ color: #333; }}
-                    .meta {{ color: #666; font-size: 0.9em; }}
-                    .content {{ margin-top: 20px; }}
-                    .tags {{ margin-top: 20px; color: #0066cc; }}
-                </style>
-            </head>
-            <body>
-                <h1>{note['title']}</h1>
-                <div class="meta">
-                    Created: {note['created']}<br>
-                    Modified: {note['modified']}
-                </div>
-                <div class="content">
-                    {markdown.markdown(note['content'])}
-                </div>
-                <div class="tags">
-                    Tags: {', '.join(note['tags'])}
-                </div>
-            </body>
-            </html>
-            """
+            if NoteTakerPro._markdown is None:
+                import markdown  # pip install markdown
+                NoteTakerPro._markdown = markdown.Markdown()
+            body = NoteTakerPro._markdown.reset().convert(note['content'])
+            html_content = HTML_TEMPLATE.format_map(dict(fields, content=body))
             with open(filename, 'w') as f:
                 f.write(html_content)
         elif format_type == 'md':
-            md_content = f"""# {note['title']}
-            
-**Created:** {note['created']}  
-**Modified:** {note['modified']}  
-
-{note['content']}
-
-**Tags:** {', '.join(note['tags'])}
-            """
+            md_content = MD_TEMPLATE.format_map(fields)
             with open(filename, 'w') as f:
                 f.write(md_content)
         else:
@@ -244,6 +571,7 @@ class NoteTakerPro:
 
     def list_notes(self):
         """List all notes"""
+        self._ensure_loaded()
         if not self.notes:
             print(Fore.YELLOW + "No notes available.")
             return
@@ -253,12 +581,13 @@ class NoteTakerPro:
 
     def view_note(self):
         """View a specific note"""
+        self._ensure_loaded()
         try:
             note_id = int(input(Fore.CYAN + "Enter note ID to view: " + Style.RESET_ALL))
         except ValueError:
             print(Fore.RED + "Invalid note ID!")
             return
-        note = next((n for n in self.notes if n['id'] == note_id), None)
+        note = self._by_id.get(note_id)
         if not note:
             print(Fore.RED + "Note not found!")
             return
@@ -273,12 +602,13 @@ class NoteTakerPro:
 
     def edit_note(self):
         """Edit an existing note"""
+        self._ensure_loaded()
         try:
             note_id = int(input(Fore.CYAN + "Enter note ID to edit: " + Style.RESET_ALL))
         except ValueError:
             print(Fore.RED + "Invalid note ID!")
             return
-        note = next((n for n in self.notes if n['id'] == note_id), None)
+        note = self._by_id.get(note_id)
         if not note:
             print(Fore.RED + "Note not found!")
             return
@@ -295,26 +625,33 @@ class NoteTakerPro:
         if new_tags_input.strip():
             note['tags'] = [tag.strip() for tag in new_tags_input.split(",") if tag.strip()]
         
-        note['modified'] = datetime.now(pytz.timezone(self.config['timezone'])).isoformat()
+        note['modified'] = self._timestamp()
+        self._columns = None
         
         self.save_notes()
         print(Fore.GREEN + "Note updated successfully!")
 
     def delete_note(self):
         """Delete a note"""
+        self._ensure_loaded()
         try:
             note_id = int(input(Fore.CYAN + "Enter note ID to delete: " + Style.RESET_ALL))
         except ValueError:
             print(Fore.RED + "Invalid note ID!")
             return
-        note = next((n for n in self.notes if n['id'] == note_id), None)
+        note = self._by_id.get(note_id)
         if not note:
             print(Fore.RED + "Note not found!")
             return
         
         confirm = input(Fore.RED + f"Are you sure you want to delete note '{note['title']}'? (y/n): " + Style.RESET_ALL)
         if confirm.lower() == 'y':
-            self.notes = [n for n in self.notes if n['id'] != note_id]
+            self.notes.remove(note)
+            del self._by_id[note_id]
+            self._columns = None
+            if self._reminder_times.pop(note_id, None):
+                self._reminders = [r for r in self._reminders if r[1] != note_id]
+                heapq.heapify(self._reminders)
             self.save_notes()
             print(Fore.GREEN + "Note deleted successfully!")
         else:
@@ -322,13 +659,11 @@ class NoteTakerPro:
 
     def search_notes(self):
         """Search notes by keyword in title, content, or tags"""
+        self._ensure_loaded()
         keyword = input(Fore.CYAN + "Enter keyword to search: " + Style.RESET_ALL).lower()
-        results = []
-        for note in self.notes:
-            if (keyword in note['title'].lower() or
-                keyword in note['content'].lower() or
-                any(keyword in tag.lower() for tag in note['tags'])):
-                results.append(note)
+        results = [self._by_id[note_id]
+                   for note_id, title, content, tags in zip(*self._search_columns())
+                   if keyword in title or keyword in content or keyword in tags]
         if not results:
             print(Fore.YELLOW + "No matching notes found.")
             return
@@ -339,14 +674,12 @@ class NoteTakerPro:
     def settings_menu(self):
         """Settings menu for encryption, cloud sync, timezone, and Dropbox token"""
         while True:
-            print(Fore.YELLOW + "\nSETTINGS")
-            print(Fore.CYAN + "1. Toggle Encryption (Currently: " + ("ON" if self.config['encrypted'] else "OFF") + ")")
-            print("2. Toggle Cloud Sync (Currently: " + ("ON" if self.config['cloud_sync'] else "OFF") + ")")
-            print("3. Set Timezone (Currently: " + self.config['timezone'] + ")")
-            print("4. Set Dropbox Token")
-            print("5. Back to Main Menu")
+            print(SETTINGS_MENU.format(
+                encrypted="ON" if self.config['encrypted'] else "OFF",
+                cloud_sync="ON" if self.config['cloud_sync'] else "OFF",
+                timezone=self.config['timezone']))
             
-            choice = input(Fore.CYAN + "Enter your choice (1-5): " + Style.RESET_ALL)
+            choice = input(SETTINGS_PROMPT)
             if choice == '1':
                 self.config['encrypted'] = not self.config['encrypted']
                 self.setup_encryption()
@@ -363,8 +696,10 @@ class NoteTakerPro:
             elif choice == '3':
                 tz = input(Fore.CYAN + "Enter timezone (e.g. UTC, US/Eastern): " + Style.RESET_ALL)
                 try:
-                    pytz.timezone(tz)  # Validate timezone
+                    self._tz = pytz.timezone(tz)  # Validate timezone
                     self.config['timezone'] = tz
+                    if self.notes is not None:
+                        self._index_reminders()
                     self.save_config()
                     print(Fore.GREEN + f"Timezone set to {tz}.")
                 except pytz.UnknownTimeZoneError:
@@ -383,18 +718,7 @@ class NoteTakerPro:
 
     def show_menu(self):
         """Display the main menu"""
-        print(Fore.YELLOW + "\nNOTE TAKER PRO")
-        print(Fore.CYAN + "1. Create Note")
-        print("2. List Notes")
-        print("3. View Note")
-        print("4. Edit Note")
-        print("5. Delete Note")
-        print("6. Search Notes")
-        print("7. Check Reminders")
-        print("8. Export Note")
-        print("9. Settings")
-        print("10. Sync Now")
-        print("11. Exit")
+        print(MAIN_MENU)
     
     def run(self):
         """Run the application"""
@@ -402,7 +726,7 @@ class NoteTakerPro:
         
         while True:
             self.show_menu()
-            choice = input(Fore.CYAN + "\nEnter your choice (1-11): " + Style.RESET_ALL)
+            choice = input(MAIN_PROMPT)
             
             try:
                 choice = int(choice)
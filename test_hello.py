@@ -0,0 +1,165 @@
+import builtins
+import json
+import threading
+
+import dropbox
+import pytest
+
+import hello
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run each test in an empty directory so notes, config and key files are isolated"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    """Answer input() prompts with the given values, in order"""
+    def feed(*answers):
+        it = iter(answers)
+        monkeypatch.setattr(builtins, 'input', lambda prompt='': next(it))
+    return feed
+
+
+def write_config(**config):
+    with open(hello.CONFIG_FILE, 'w') as f:
+        json.dump(config, f)
+
+
+def read_notes():
+    with open(hello.NOTES_FILE, 'rb') as f:
+        return json.loads(f.read())
+
+
+def create(app, feed, title, content='', tags='', reminder=None):
+    if reminder:
+        feed(title, content, tags, 'y', reminder)
+    else:
+        feed(title, content, tags, 'n')
+    app.create_note()
+
+
+def test_encrypted_notes_load_after_encryption_is_turned_off(feed):
+    write_config(encrypted=True)
+    app = hello.NoteTakerPro()
+    create(app, feed, 'secret')
+    with open(hello.NOTES_FILE, 'rb') as f:
+        assert f.read().startswith(hello.FERNET_MAGIC)
+
+    write_config(encrypted=False)
+    app = hello.NoteTakerPro()
+    create(app, feed, 'plain')
+    assert [n['title'] for n in read_notes()] == ['secret', 'plain']
+
+
+def test_failed_load_does_not_overwrite_notes_file(feed):
+    with open(hello.NOTES_FILE, 'w') as f:
+        f.write('[{"id": 1')
+    app = hello.NoteTakerPro()
+    create(app, feed, 'new')
+    with open(hello.NOTES_FILE) as f:
+        assert f.read() == '[{"id": 1'
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeDropbox:
+    """In-memory stand-in for dropbox.Dropbox that records uploaded files"""
+    def __init__(self):
+        self.files = {}
+        self.uploads = []
+        self.started = threading.Event()  # Set when an upload begins
+        self.gate = threading.Event()  # Uploads block until this is set
+        self.gate.set()
+
+    def files_upload(self, data, path, mode=None):
+        self.started.set()
+        self.gate.wait()
+        self.files[path] = data
+        self.uploads.append(path)
+
+    def files_download(self, path):
+        if path not in self.files:
+            error = dropbox.files.DownloadError.path(dropbox.files.LookupError.not_found)
+            raise dropbox.exceptions.ApiError('request-id', error, None, None)
+        return None, FakeResponse(self.files[path])
+
+
+@pytest.fixture
+def cloud_app(monkeypatch):
+    """Return a factory for apps with cloud sync on, a short sync delay and a fake client"""
+    monkeypatch.setattr(hello, 'SYNC_DELAY', 0.05)
+    write_config(cloud_sync=True, dropbox_token='token')
+
+    def make(dbx):
+        app = hello.NoteTakerPro()
+        app.dbx = dbx
+        return app
+    return make
+
+
+def test_sync_from_cloud_waits_for_running_upload(feed, cloud_app):
+    dbx = FakeDropbox()
+    app = cloud_app(dbx)
+    create(app, feed, 'A')
+    app._flush_to_cloud().result()  # The cloud now holds a copy with only A
+
+    dbx.gate.clear()
+    dbx.started.clear()
+    create(app, feed, 'B')
+    app._flush_to_cloud()
+    assert dbx.started.wait(5)  # The upload of A and B is running but held
+
+    sync = threading.Thread(target=app.sync_from_cloud)
+    sync.start()
+    try:
+        sync.join(0.2)
+        assert sync.is_alive()  # Still waiting for the upload
+    finally:
+        dbx.gate.set()
+    sync.join(5)
+    assert [n['title'] for n in app.notes] == ['A', 'B']
+
+
+def test_sync_from_cloud_reads_legacy_uncompressed_copy(cloud_app):
+    dbx = FakeDropbox()
+    dbx.files['/notes.json'] = b'[{"id": 1, "title": "old", "content": "", "tags": []}]'
+    app = cloud_app(dbx)
+    app.sync_from_cloud()
+    assert [n['title'] for n in app.notes] == ['old']
+
+
+def test_cloud_path_follows_compress_setting(feed, cloud_app):
+    write_config(cloud_sync=True, dropbox_token='token', cloud_compress=False)
+    dbx = FakeDropbox()
+    app = cloud_app(dbx)
+    create(app, feed, 'A')
+    app.close()
+    assert dbx.uploads == ['/notes.json']
+    assert json.loads(dbx.files['/notes.json'])[0]['title'] == 'A'
+
+
+def test_duplicate_ids_are_renumbered_on_load(feed):
+    notes = [{'id': i, 'title': t, 'content': '', 'tags': [], 'created': '', 'modified': ''}
+             for i, t in [(1, 'a'), (2, 'b'), (2, 'c')]]
+    with open(hello.NOTES_FILE, 'w') as f:
+        json.dump(notes, f)
+    app = hello.NoteTakerPro()
+    feed('2', 'y')
+    app.delete_note()
+    assert [(n['id'], n['title']) for n in app.notes] == [(1, 'a'), (3, 'c')]
+    assert app._by_id[3]['title'] == 'c'
+    assert [n['id'] for n in read_notes()] == [1, 3]
+
+
+def test_saved_notes_hold_only_note_fields(feed):
+    app = hello.NoteTakerPro()
+    create(app, feed, 'A', reminder='2999-01-01 10:00')
+    assert set(read_notes()[0]) == {'id', 'title', 'content', 'tags', 'created', 'modified', 'reminder'}
+    assert app._reminder_times[1].year == 2999